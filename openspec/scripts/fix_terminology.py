@@ -10,11 +10,16 @@ Applies canonical terminology standard from TERMINOLOGY_GLOSSARY.md:
 This script uses context-aware replacement rules.
 """
 
+import hashlib
+import json
 import re
 import os
 import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
-from typing import List, Tuple, Dict
+from typing import List, Optional, Tuple, Dict
 
 # Patterns requiring "BattleMech" (formal contexts)
 FORMAL_CONTEXTS = [
@@ -29,7 +34,7 @@ FORMAL_CONTEXTS = [
     (r'(\bmech\s+construction\b)', 'BattleMech construction'),
 
     # Scenario headings
-    (r'(####\s+Scenario:\s+)(?:Light|Medium|Heavy|Assault)\s+mech\s+', r'\1\g<2> BattleMech '),
+    (r'(####\s+Scenario:\s+)(Light|Medium|Heavy|Assault)\s+mech\s+', r'\1\g<2> BattleMech '),
 
     # Property descriptions
     (r'(\*\*\w+\*\*:\s+)Mech\s+', r'\1BattleMech '),
@@ -48,6 +53,12 @@ FORMAL_CONTEXTS = [
     # "a mech" / "the mech" in formal validation/requirements
     (r'(validating|validate)\s+the\s+mech\b', r'\1 the BattleMech'),
     (r'(\bGIVEN\s+)a\s+mech\s+', r'\1a BattleMech '),
+]
+
+# Scenario steps: each match runs from WHEN/THEN to the last "mech" on the
+# line, so these rules would swallow any other target on that line. They run
+# after the formal contexts and repeat until the text stops changing.
+SCENARIO_STEP_CONTEXTS = [
     (r'(\bWHEN\s+.*)\s+mech\s+', r'\1 BattleMech '),
     (r'(\bTHEN\s+.*)\s+mech\s+', r'\1 BattleMech '),
 ]
@@ -59,6 +70,60 @@ CAPITALIZATION_FIXES = [
     (r'\bbattle\s+mech\b', 'BattleMech'),  # In formal contexts
 ]
 
+# Every fix rule above matches this token (case-insensitively), so files
+# without it can skip the regex passes entirely. Searched in place rather
+# than via .lower(), which would copy the whole file first.
+CANDIDATE_PATTERN = re.compile('mech', re.IGNORECASE)
+
+# Matches \N and \g<N> group references in a replacement template
+_GROUP_REF = re.compile(r'\\(?:(\d+)|g<(\d+)>)')
+
+
+def fuse_rules(rules: List[Tuple[str, str, int]]) -> Tuple[re.Pattern, List[str]]:
+    """Combine (pattern, replacement, flags) rules into one alternation.
+
+    Each rule is wrapped in a named group ``r<index>`` so a match can be
+    dispatched back to its rule via ``match.lastgroup``; ``re.IGNORECASE``
+    is applied per rule as a scoped ``(?i:...)`` group. Group numbers inside
+    each rule shift by the groups that precede it, so the replacement
+    templates are renumbered to match.
+    """
+    parts = []
+    templates = []
+    offset = 0
+    for index, (pattern, replacement, flags) in enumerate(rules):
+        base = offset + 1
+        scoped = f'(?i:{pattern})' if flags & re.IGNORECASE else pattern
+        parts.append(f'(?P<r{index}>{scoped})')
+        templates.append(_GROUP_REF.sub(
+            lambda m: f'\\g<{int(m.group(1) or m.group(2)) + base}>', replacement
+        ))
+        offset = base + re.compile(pattern).groups
+    return re.compile('|'.join(parts)), templates
+
+
+# Rule groups in the order they are applied. Each group runs as one fused
+# pass; the groups stay separate because a match from one can consume text
+# another group still needs to fix. Compiled once at import so per-file passes
+# don't go through the re cache.
+CAPITALIZATION_RULES = [(pattern, replacement, 0) for pattern, replacement in CAPITALIZATION_FIXES]
+FORMAL_RULES = [(pattern, replacement, re.IGNORECASE) for pattern, replacement in FORMAL_CONTEXTS]
+FUSED_PASSES = [
+    ('Fixed capitalization:', CAPITALIZATION_RULES, *fuse_rules(CAPITALIZATION_RULES)),
+    ('Replaced', FORMAL_RULES, *fuse_rules(FORMAL_RULES)),
+]
+SCENARIO_STEP_RULES = [
+    (pattern, replacement, re.compile(pattern, re.IGNORECASE))
+    for pattern, replacement in SCENARIO_STEP_CONTEXTS
+]
+
+# Files that needed no fixes on a previous run, keyed by absolute path with
+# their [mtime_ns, size] at the time. Entries are only trusted for the exact
+# script source they were recorded against, so any edit to the rules or to
+# the code that applies them invalidates the cache.
+CLEAN_CACHE_PATH = Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache') / 'mekstation-terminology.json'
+RULES_FINGERPRINT = hashlib.sha1(Path(__file__).read_bytes()).hexdigest()
+
 # Contexts where "mech" is acceptable (after BattleMech established)
 # These are kept as-is:
 # - Comments starting with "//"
@@ -67,8 +132,9 @@ CAPITALIZATION_FIXES = [
 # - Informal prose descriptions
 
 class TerminologyFixer:
-    def __init__(self, dry_run=False):
+    def __init__(self, dry_run=False, backup=False):
         self.dry_run = dry_run
+        self.backup = backup
         self.changes = []
 
     def should_skip_line(self, line: str, in_code_block: bool) -> bool:
@@ -87,76 +153,153 @@ class TerminologyFixer:
 
         return False
 
-    def fix_formal_contexts(self, content: str) -> str:
-        """Apply formal context replacements."""
+    def apply_fixes(self, content: str) -> str:
+        """Apply capitalization, formal context and scenario step fixes.
+
+        Every target on a line is fixed, and fixed text is left alone on a
+        second run:
+
+        >>> fixer = TerminologyFixer()
+        >>> fixer.apply_fixes('WHEN the mech tonnage exceeds limit and the mech is destroyed ')
+        'WHEN the BattleMech tonnage exceeds limit and the BattleMech is destroyed '
+        >>> fixer.apply_fixes('WHEN a battle mech is mech tonnage ok')
+        'WHEN a BattleMech is BattleMech tonnage ok'
+        >>> fixed = fixer.apply_fixes('THEN the mech and the mech fall ')
+        >>> fixed, fixer.apply_fixes(fixed) == fixed
+        ('THEN the BattleMech and the BattleMech fall ', True)
+        """
         modified = content
 
-        for pattern, replacement in FORMAL_CONTEXTS:
-            original = modified
-            modified = re.sub(pattern, replacement, modified, flags=re.IGNORECASE)
-            if modified != original:
-                matches = len(re.findall(pattern, original, flags=re.IGNORECASE))
-                self.changes.append(f"  - Replaced '{pattern}' → '{replacement}' ({matches} instances)")
-
-        return modified
-
-    def fix_capitalizations(self, content: str) -> str:
-        """Fix capitalization errors."""
-        modified = content
-
-        for pattern, replacement in CAPITALIZATION_FIXES:
-            original = modified
-            modified = re.sub(pattern, replacement, modified)
-            if modified != original:
-                matches = len(re.findall(pattern, original))
-                self.changes.append(f"  - Fixed capitalization: '{pattern}' → '{replacement}' ({matches} instances)")
+        for label, rules, fused, templates in FUSED_PASSES:
+            counts = [0] * len(rules)
+
+            def expand(match: re.Match) -> str:
+                index = int(match.lastgroup[1:])
+                counts[index] += 1
+                return match.expand(templates[index])
+
+            modified = fused.sub(expand, modified)
+            for (pattern, replacement, _), matches in zip(rules, counts):
+                if matches:
+                    self.changes.append(f"  - {label} '{pattern}' → '{replacement}' ({matches} instances)")
+
+        # Each step match fixes only the last "mech" on its line; repeat for the rest
+        for pattern, replacement, compiled in SCENARIO_STEP_RULES:
+            total = 0
+            while True:
+                modified, matches = compiled.subn(replacement, modified)
+                if not matches:
+                    break
+                total += matches
+            if total:
+                self.changes.append(f"  - Replaced '{pattern}' → '{replacement}' ({total} instances)")
 
         return modified
 
     def process_file(self, file_path: Path) -> bool:
-        """Process a single file."""
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                original_content = f.read()
-
-            modified_content = original_content
+        """Process a single file, leaving its change log in ``self.changes``."""
+        with open(file_path, 'r', encoding='utf-8') as f:
+            original_content = f.read()
 
-            # Apply fixes
-            modified_content = self.fix_capitalizations(modified_content)
-            modified_content = self.fix_formal_contexts(modified_content)
-
-            if modified_content != original_content:
-                if not self.dry_run:
-                    # Create backup
-                    backup_path = file_path.with_suffix('.md.bak')
-                    with open(backup_path, 'w', encoding='utf-8') as f:
-                        f.write(original_content)
-
-                    # Write modified content
-                    with open(file_path, 'w', encoding='utf-8') as f:
-                        f.write(modified_content)
-
-                    print(f"✓ Updated: {file_path.relative_to(file_path.parents[3])}")
-                else:
-                    print(f"Would update: {file_path.relative_to(file_path.parents[3])}")
-
-                for change in self.changes:
-                    print(change)
-                self.changes = []
+        if not CANDIDATE_PATTERN.search(original_content):
+            return False
 
-                return True
+        modified_content = self.apply_fixes(original_content)
 
+        if modified_content == original_content:
             return False
 
-        except Exception as e:
-            print(f"✗ Error processing {file_path}: {e}", file=sys.stderr)
-            return False
+        if not self.dry_run:
+            if self.backup:
+                backup_path = file_path.with_suffix('.md.bak')
+                with open(backup_path, 'w', encoding='utf-8') as f:
+                    f.write(original_content)
+
+            write_atomic(file_path, modified_content)
+
+        return True
+
+
+def write_atomic(file_path: Path, content: str) -> None:
+    """Write via a sibling temp file and rename it over the target.
+
+    A symlinked target is followed, so the link stays a link and the file it
+    points at gets the new content. Permission bits are kept; ownership is not.
+    """
+    target = os.path.realpath(file_path)
+    try:
+        mode = os.stat(target).st_mode
+    except FileNotFoundError:
+        mode = None
+    f = tempfile.NamedTemporaryFile(
+        'w', encoding='utf-8', dir=os.path.dirname(target), suffix='.tmp', delete=False
+    )
+    replaced = False
+    try:
+        with f:
+            f.write(content)
+        if mode is not None:
+            os.chmod(f.name, mode)
+        os.replace(f.name, target)
+        replaced = True
+    finally:
+        # Never leave a stray temp file next to the target
+        if not replaced:
+            os.unlink(f.name)
+
+
+def load_clean_cache() -> Dict[str, List[int]]:
+    """Load the clean-file cache, discarding it if the rules have changed."""
+    try:
+        with open(CLEAN_CACHE_PATH, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get('rules') != RULES_FINGERPRINT:
+        return {}
+    return data.get('files', {})
+
+
+def save_clean_cache(files: Dict[str, List[int]]) -> None:
+    """Persist the clean-file cache; failures only cost the next run time."""
+    try:
+        CLEAN_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        write_atomic(CLEAN_CACHE_PATH, json.dumps({'rules': RULES_FINGERPRINT, 'files': files}))
+    except OSError as e:
+        print(f"Warning: could not save {CLEAN_CACHE_PATH}: {e}", file=sys.stderr)
+
+
+def process_file_worker(
+    path: str, dry_run: bool, backup: bool
+) -> Tuple[str, bool, str, Optional[str]]:
+    """Process one file in a worker process.
+
+    Takes and returns the path as a plain string, which is cheaper to pickle
+    than a ``Path``. Returns ``(path, changed, report, error)`` instead of
+    printing; ``report`` is the file's pre-rendered output block, so the
+    parent can emit every result in one write, in a stable order.
+    """
+    file_path = Path(path)
+    fixer = TerminologyFixer(dry_run=dry_run, backup=backup)
+    try:
+        if not fixer.process_file(file_path):
+            return path, False, '', None
+        label = 'Would update' if dry_run else '✓ Updated'
+        lines = [f"{label}: {file_path.relative_to(file_path.parents[3])}", *fixer.changes]
+    except Exception as e:
+        return path, False, '', str(e)
+    return path, True, '\n'.join(lines), None
+
 
 def main():
     import argparse
 
     parser = argparse.ArgumentParser(description='Fix BattleMech/mech/unit terminology')
     parser.add_argument('--dry-run', action='store_true', help='Show what would be changed without modifying files')
+    parser.add_argument('--backup', action=argparse.BooleanOptionalAction, default=False,
+                        help='Keep a .md.bak copy of each modified file (default: off; git has the history)')
+    parser.add_argument('--no-cache', action='store_true',
+                        help=f'Neither read nor update the clean-file cache ({CLEAN_CACHE_PATH})')
     parser.add_argument('path', nargs='?', default='.', help='Path to openspec/specs directory')
     args = parser.parse_args()
 
@@ -165,23 +308,83 @@ def main():
         print(f"Error: Directory {specs_dir} does not exist", file=sys.stderr)
         return 1
 
-    fixer = TerminologyFixer(dry_run=args.dry_run)
-
-    # Find all .md files
-    md_files = list(specs_dir.rglob('*.md'))
+    # Find all .md files (plain suffix check; no Path/fnmatch per entry)
+    md_files = []
+    for root, _dirs, files in os.walk(specs_dir):
+        for name in files:
+            if name.endswith('.md'):
+                md_files.append(os.path.join(root, name))
+    md_files.sort(key=lambda p: p.split(os.sep))
+
+    errors = []
+    if args.no_cache:
+        clean_cache = None
+        pending = md_files
+        skipped = 0
+    else:
+        # Skip files whose size and mtime match a previous clean (no-fix) run
+        clean_cache = load_clean_cache()
+        stamps = {}
+        pending = []
+        skipped = 0
+        for path in md_files:
+            key = os.path.abspath(path)
+            try:
+                st = os.stat(path)
+            except OSError as e:
+                # e.g. a dangling symlink; report it like a failed worker
+                errors.append(f"✗ Error processing {path}: {e}")
+                clean_cache.pop(key, None)
+                continue
+            stamp = [st.st_mtime_ns, st.st_size]
+            if clean_cache.get(key) == stamp:
+                skipped += 1
+                continue
+            stamps[path] = (key, stamp)
+            pending.append(path)
 
     print(f"Found {len(md_files)} markdown files")
+    if skipped:
+        print(f"Skipping {skipped} files unchanged since a clean run")
     if args.dry_run:
         print("DRY RUN - No files will be modified\n")
     else:
         print("Processing files...\n")
 
     updated_count = 0
-    for md_file in sorted(md_files):
-        if fixer.process_file(md_file):
-            updated_count += 1
-
-    print(f"\n{'Would update' if args.dry_run else 'Updated'} {updated_count} files")
+    reports = []
+    with ProcessPoolExecutor() as executor:
+        results = executor.map(
+            process_file_worker, pending, repeat(args.dry_run), repeat(args.backup), chunksize=16
+        )
+        for path, changed, report, error in results:
+            if error is not None:
+                errors.append(f"✗ Error processing {path}: {error}")
+            elif changed:
+                updated_count += 1
+                reports.append(report)
+            if clean_cache is not None:
+                key, stamp = stamps[path]
+                if error is None and not changed:
+                    clean_cache[key] = stamp
+                else:
+                    clean_cache.pop(key, None)
+
+    if clean_cache is not None:
+        # Forget files under this tree that were deleted or renamed since
+        scanned_root = os.path.join(os.path.abspath(specs_dir), '')
+        present = {os.path.abspath(path) for path in md_files}
+        clean_cache = {
+            key: stamp for key, stamp in clean_cache.items()
+            if key in present or not key.startswith(scanned_root)
+        }
+        save_clean_cache(clean_cache)
+
+    reports.append(f"\n{'Would update' if args.dry_run else 'Updated'} {updated_count} files")
+    sys.stdout.write('\n'.join(reports) + '\n')
+    sys.stdout.flush()
+    if errors:
+        sys.stderr.write('\n'.join(errors) + '\n')
 
     return 0
 
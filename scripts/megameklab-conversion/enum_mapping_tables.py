@@ -2,9 +2,22 @@
 
 from __future__ import annotations
 
-from typing import Dict
+import sys
+from types import MappingProxyType
+from typing import Dict, Mapping
 
-TECH_BASE_MAP: Dict[str, str] = {
+
+def _interned(mapping: Dict[str, str]) -> Mapping[str, str]:
+    """Intern every value so each enum string is one shared object.
+
+    The table comes back read-only. The ``map_*`` mappers memoize their
+    results, so a later edit would be silently ignored for values already seen.
+    """
+    interned = {key: sys.intern(value) for key, value in mapping.items()}
+    return MappingProxyType(interned)
+
+
+TECH_BASE_MAP: Mapping[str, str] = _interned({
     # Standard variations
     "Inner Sphere": "INNER_SPHERE",
     "IS": "INNER_SPHERE",
@@ -24,9 +37,9 @@ TECH_BASE_MAP: Dict[str, str] = {
     "0": "INNER_SPHERE",
     "1": "CLAN",
     "2": "MIXED",
-}
+})
 
-RULES_LEVEL_MAP: Dict[str, str] = {
+RULES_LEVEL_MAP: Mapping[str, str] = _interned({
     # Numeric rules levels
     "0": "INTRODUCTORY",
     "1": "STANDARD",
@@ -47,9 +60,9 @@ RULES_LEVEL_MAP: Dict[str, str] = {
     # Clan Level variations
     "Clan Level 2": "STANDARD",
     "Clan Level 3": "ADVANCED",
-}
+})
 
-ENGINE_TYPE_MAP: Dict[str, str] = {
+ENGINE_TYPE_MAP: Mapping[str, str] = _interned({
     # Standard engines
     "Fusion Engine": "FUSION",
     "Fusion Engine(IS)": "FUSION",
@@ -95,9 +108,9 @@ ENGINE_TYPE_MAP: Dict[str, str] = {
     "3": "COMPACT",
     "4": "CLAN_XL",
     "5": "XXL",
-}
+})
 
-GYRO_TYPE_MAP: Dict[str, str] = {
+GYRO_TYPE_MAP: Mapping[str, str] = _interned({
     "Standard Gyro": "STANDARD",
     "Standard": "STANDARD",
     "XL Gyro": "XL",
@@ -114,9 +127,9 @@ GYRO_TYPE_MAP: Dict[str, str] = {
     "2": "COMPACT",
     "3": "HEAVY_DUTY",
     "4": "SUPERHEAVY",
-}
+})
 
-COCKPIT_TYPE_MAP: Dict[str, str] = {
+COCKPIT_TYPE_MAP: Mapping[str, str] = _interned({
     "Standard Cockpit": "STANDARD",
     "Standard": "STANDARD",
     "Small Cockpit": "SMALL",
@@ -137,9 +150,9 @@ COCKPIT_TYPE_MAP: Dict[str, str] = {
     "Superheavy Tripod Cockpit": "SUPERHEAVY_TRIPOD",
     "Interface Cockpit": "INTERFACE",
     "QuadVee Cockpit": "QUADVEE",
-}
+})
 
-STRUCTURE_TYPE_MAP: Dict[str, str] = {
+STRUCTURE_TYPE_MAP: Mapping[str, str] = _interned({
     "Standard": "STANDARD",
     "IS Standard": "STANDARD",
     "Standard Structure": "STANDARD",
@@ -156,9 +169,9 @@ STRUCTURE_TYPE_MAP: Dict[str, str] = {
     "Composite Structure": "COMPOSITE",
     "Industrial": "INDUSTRIAL",
     "Industrial Structure": "INDUSTRIAL",
-}
+})
 
-ARMOR_TYPE_MAP: Dict[str, str] = {
+ARMOR_TYPE_MAP: Mapping[str, str] = _interned({
     "Standard": "STANDARD",
     "Standard Armor": "STANDARD",
     "Standard(Inner Sphere)": "STANDARD",
@@ -191,9 +204,9 @@ ARMOR_TYPE_MAP: Dict[str, str] = {
     "Heavy Industrial Armor": "HEAVY_INDUSTRIAL",
     "Impact-Resistant": "IMPACT_RESISTANT",
     "Impact-Resistant Armor": "IMPACT_RESISTANT",
-}
+})
 
-HEAT_SINK_TYPE_MAP: Dict[str, str] = {
+HEAT_SINK_TYPE_MAP: Mapping[str, str] = _interned({
     "Single": "SINGLE",
     "Single Heat Sink": "SINGLE",
     "Single Heat Sinks": "SINGLE",
@@ -208,9 +221,9 @@ HEAT_SINK_TYPE_MAP: Dict[str, str] = {
     "Compact Heat Sink": "COMPACT",
     "Laser": "LASER",
     "Laser Heat Sink": "LASER",
-}
+})
 
-MECH_LOCATION_MAP: Dict[str, str] = {
+MECH_LOCATION_MAP: Mapping[str, str] = _interned({
     # Standard locations
     "Head": "HEAD",
     "HD": "HEAD",
@@ -246,9 +259,9 @@ MECH_LOCATION_MAP: Dict[str, str] = {
     "RLL": "REAR_LEFT_LEG",
     "Rear Right Leg": "REAR_RIGHT_LEG",
     "RRL": "REAR_RIGHT_LEG",
-}
+})
 
-ARMOR_LOCATION_KEY_MAP: Dict[str, str] = {
+ARMOR_LOCATION_KEY_MAP: Mapping[str, str] = _interned({
     "la armor": "LEFT_ARM",
     "ra armor": "RIGHT_ARM",
     "lt armor": "LEFT_TORSO",
@@ -272,9 +285,15 @@ ARMOR_LOCATION_KEY_MAP: Dict[str, str] = {
     "rtl": "LEFT_TORSO_REAR",
     "rtr": "RIGHT_TORSO_REAR",
     "rtc": "CENTER_TORSO_REAR",
-}
+})
 
-MECH_CONFIG_MAP: Dict[str, str] = {
+# Single case-folded table over both location maps, so a lookup is one probe.
+MECH_LOCATION_LOOKUP: Mapping[str, str] = MappingProxyType({
+    **{key.lower(): value for key, value in MECH_LOCATION_MAP.items()},
+    **ARMOR_LOCATION_KEY_MAP,
+})
+
+MECH_CONFIG_MAP: Mapping[str, str] = _interned({
     "Biped": "Biped",
     "Quad": "Quad",
     "Tripod": "Tripod",
@@ -282,23 +301,9 @@ MECH_CONFIG_MAP: Dict[str, str] = {
     "QuadVee": "QuadVee",
     "Biped Omnimech": "Biped",
     "Quad Omnimech": "Quad",
-}
-
-ERA_MAP: Dict[int, str] = {
-    # By year ranges
-    # Age of War: 2005-2570
-    # Star League: 2571-2780
-    # Early Succession Wars: 2781-2900
-    # Late Succession Wars: 2901-3019
-    # Renaissance: 3020-3049
-    # Clan Invasion: 3050-3061
-    # Civil War: 3062-3067
-    # Jihad: 3068-3085
-    # Dark Age: 3086-3150
-    # ilClan: 3151+
-}
+})
 
-UNIT_TYPE_MAP: Dict[str, str] = {
+UNIT_TYPE_MAP: Mapping[str, str] = _interned({
     "BattleMech": "BattleMech",
     "Mech": "BattleMech",
     "Biped": "BattleMech",
@@ -328,4 +333,22 @@ UNIT_TYPE_MAP: Dict[str, str] = {
     "Battle Armor": "Battle Armor",
     "Support Vehicle": "Support Vehicle",
     "SupportVehicle": "Support Vehicle",
-}
+})
+
+ERA_FOLDER_MAP: Mapping[str, str] = MappingProxyType({
+    "EARLY_SPACEFLIGHT": "0-early-spaceflight",
+    "AGE_OF_WAR": "1-age-of-war",
+    "STAR_LEAGUE": "2-star-league",
+    "SUCCESSION_WARS": "3-succession-wars",
+    "CLAN_INVASION": "4-clan-invasion",
+    "CIVIL_WAR": "5-civil-war",
+    "DARK_AGE": "6-dark-age",
+    "ILCLAN": "7-ilclan",
+})
+
+RULES_LEVEL_FOLDER_MAP: Mapping[str, str] = MappingProxyType({
+    "INTRODUCTORY": "introductory",
+    "STANDARD": "standard",
+    "ADVANCED": "advanced",
+    "EXPERIMENTAL": "experimental",
+})
@@ -4,11 +4,20 @@ Enum Mappings for MTF to TypeScript Conversion
 Maps MegaMek MTF format strings to TypeScript enum values used in megamek-web.
 These mappings ensure consistent data conversion from legacy MTF files.
 
+The ``map_*`` string mappers are pure and see only a few dozen distinct
+values across a whole corpus, so they are memoized with ``lru_cache``. The ID
+helpers are memoized too, with a larger cache: equipment names repeat across
+thousands of units.
+
 Usage:
     from enum_mappings import map_tech_base, map_engine_type, map_armor_location
 """
 
 import os
+import re
+import sys
+from bisect import bisect_right
+from functools import lru_cache
 from typing import Optional, Dict
 from enum_mapping_tables import (
     TECH_BASE_MAP,
@@ -19,11 +28,11 @@ from enum_mapping_tables import (
     STRUCTURE_TYPE_MAP,
     ARMOR_TYPE_MAP,
     HEAT_SINK_TYPE_MAP,
-    MECH_LOCATION_MAP,
-    ARMOR_LOCATION_KEY_MAP,
+    MECH_LOCATION_LOOKUP,
     MECH_CONFIG_MAP,
-    ERA_MAP,
     UNIT_TYPE_MAP,
+    ERA_FOLDER_MAP,
+    RULES_LEVEL_FOLDER_MAP,
 )
 
 
@@ -48,10 +57,15 @@ def default_mm_data_root() -> str:
 
 
 
+@lru_cache(maxsize=1024)
 def map_tech_base(value: str) -> str:
     """Map MTF tech base string to TypeScript enum value."""
     clean = value.strip()
-    return TECH_BASE_MAP.get(clean, TECH_BASE_MAP.get(clean.title(), "INNER_SPHERE"))
+    tech_base = TECH_BASE_MAP.get(clean)
+    if tech_base is None:
+        # Only build the title-cased variant on a miss
+        tech_base = TECH_BASE_MAP.get(clean.title(), "INNER_SPHERE")
+    return tech_base
 
 
 # =============================================================================
@@ -60,6 +74,7 @@ def map_tech_base(value: str) -> str:
 
 
 
+@lru_cache(maxsize=1024)
 def map_rules_level(value: str) -> str:
     """Map MTF rules level to TypeScript enum value."""
     clean = value.strip()
@@ -78,6 +93,7 @@ def map_rules_level(value: str) -> str:
 
 
 
+@lru_cache(maxsize=1024)
 def map_engine_type(value: str) -> str:
     """Map MTF engine type to TypeScript enum value."""
     clean = value.strip()
@@ -110,6 +126,7 @@ def map_engine_type(value: str) -> str:
 
 
 
+@lru_cache(maxsize=1024)
 def map_gyro_type(value: str) -> str:
     """Map MTF gyro type to TypeScript enum value."""
     clean = value.strip()
@@ -133,6 +150,7 @@ def map_gyro_type(value: str) -> str:
 
 
 
+@lru_cache(maxsize=1024)
 def map_cockpit_type(value: str) -> str:
     """Map MTF cockpit type to TypeScript enum value."""
     clean = value.strip()
@@ -145,6 +163,7 @@ def map_cockpit_type(value: str) -> str:
 
 
 
+@lru_cache(maxsize=1024)
 def map_structure_type(value: str) -> str:
     """Map MTF structure type to TypeScript enum value."""
     clean = value.strip()
@@ -172,6 +191,7 @@ def map_structure_type(value: str) -> str:
 
 
 
+@lru_cache(maxsize=1024)
 def map_armor_type(value: str) -> str:
     """Map MTF armor type to TypeScript enum value."""
     clean = value.strip()
@@ -213,6 +233,7 @@ def map_armor_type(value: str) -> str:
 
 
 
+@lru_cache(maxsize=1024)
 def map_heat_sink_type(value: str) -> str:
     """Map MTF heat sink type to TypeScript enum value."""
     clean = value.strip()
@@ -238,16 +259,15 @@ def map_heat_sink_type(value: str) -> str:
 # Armor location key mappings (from MTF armor lines)
 
 
+@lru_cache(maxsize=1024)
 def map_mech_location(value: str) -> str:
-    """Map MTF location string to TypeScript enum value."""
+    """Map MTF location string to TypeScript enum value (case-insensitive)."""
     clean = value.strip()
-    if clean in MECH_LOCATION_MAP:
-        return MECH_LOCATION_MAP[clean]
-    lower = clean.lower()
-    if lower in ARMOR_LOCATION_KEY_MAP:
-        return ARMOR_LOCATION_KEY_MAP[lower]
+    location = MECH_LOCATION_LOOKUP.get(clean.lower())
+    if location is not None:
+        return location
     # Default
-    return clean.upper().replace(" ", "_")
+    return sys.intern(clean.upper().replace(" ", "_"))
 
 
 # =============================================================================
@@ -256,6 +276,7 @@ def map_mech_location(value: str) -> str:
 
 
 
+@lru_cache(maxsize=1024)
 def map_mech_config(value: str) -> str:
     """Map MTF config to TypeScript enum value."""
     clean = value.strip()
@@ -268,50 +289,51 @@ def map_mech_config(value: str) -> str:
 
 
 
+# First year of each era after the earliest; _ERA_NAMES[i] covers the years
+# before _ERA_BOUNDS[i] (and ILCLAN everything from the last bound on).
+_ERA_BOUNDS = (2005, 2571, 2781, 3050, 3068, 3081, 3152)
+_ERA_NAMES = (
+    "EARLY_SPACEFLIGHT",
+    "AGE_OF_WAR",
+    "STAR_LEAGUE",
+    "SUCCESSION_WARS",
+    "CLAN_INVASION",
+    "CIVIL_WAR",
+    "DARK_AGE",
+    "ILCLAN",
+)
+# Folder name for each entry of _ERA_NAMES
+_ERA_FOLDERS = tuple(ERA_FOLDER_MAP[name] for name in _ERA_NAMES)
+
+
 def map_year_to_era(year: int) -> str:
-    """Map introduction year to BattleTech era string (matches TypeScript Era enum)."""
-    if year < 2005:
-        return "EARLY_SPACEFLIGHT"
-    elif year < 2571:
-        return "AGE_OF_WAR"
-    elif year < 2781:
-        return "STAR_LEAGUE"
-    elif year < 3050:
-        return "SUCCESSION_WARS"
-    elif year < 3068:
-        return "CLAN_INVASION"
-    elif year < 3081:
-        return "CIVIL_WAR"
-    elif year < 3152:
-        return "DARK_AGE"
-    else:
-        return "ILCLAN"
+    """Map introduction year to BattleTech era string (matches TypeScript Era enum).
+
+    Early Spaceflight: before 2005
+    Age of War: 2005-2570
+    Star League: 2571-2780
+    Succession Wars: 2781-3049
+    Clan Invasion: 3050-3067
+    Civil War: 3068-3080
+    Dark Age: 3081-3151
+    ilClan: 3152+
+    """
+    return _ERA_NAMES[bisect_right(_ERA_BOUNDS, year)]
 
 
 def get_era_folder_name(era: str) -> str:
     """Get a folder-safe name for an era with chronological prefix."""
-    era_folders = {
-        "EARLY_SPACEFLIGHT": "0-early-spaceflight",
-        "AGE_OF_WAR": "1-age-of-war",
-        "STAR_LEAGUE": "2-star-league",
-        "SUCCESSION_WARS": "3-succession-wars",
-        "CLAN_INVASION": "4-clan-invasion",
-        "CIVIL_WAR": "5-civil-war",
-        "DARK_AGE": "6-dark-age",
-        "ILCLAN": "7-ilclan",
-    }
-    return era_folders.get(era, "99-unknown")
+    return ERA_FOLDER_MAP.get(era, "99-unknown")
+
+
+def year_to_era_folder(year: int) -> str:
+    """Get the era folder name for an introduction year in one step."""
+    return _ERA_FOLDERS[bisect_right(_ERA_BOUNDS, year)]
 
 
 def get_rules_level_folder_name(rules_level: str) -> str:
     """Get a folder-safe name for a rules level."""
-    rules_folders = {
-        "INTRODUCTORY": "introductory",
-        "STANDARD": "standard",
-        "ADVANCED": "advanced",
-        "EXPERIMENTAL": "experimental",
-    }
-    return rules_folders.get(rules_level, "standard")
+    return RULES_LEVEL_FOLDER_MAP.get(rules_level, "standard")
 
 
 # =============================================================================
@@ -320,29 +342,41 @@ def get_rules_level_folder_name(rules_level: str) -> str:
 
 
 
+_DEFAULT_UNIT_TYPE = sys.intern("BattleMech")
+
+
+@lru_cache(maxsize=1024)
 def map_unit_type(value: str) -> str:
     """Map MTF unit type to TypeScript enum value."""
-    clean = value.strip()
-    return UNIT_TYPE_MAP.get(clean, "BattleMech")
+    unit_type = UNIT_TYPE_MAP.get(value)
+    if unit_type is not None:
+        return unit_type
+    # Only strip when the raw value misses
+    return UNIT_TYPE_MAP.get(value.strip(), _DEFAULT_UNIT_TYPE)
 
 
 # =============================================================================
 # UTILITY FUNCTIONS
 # =============================================================================
 
+_MULTIDASH = re.compile(r"-{2,}")
+
+
+@lru_cache(maxsize=8192)
 def generate_id_from_name(chassis: str, model: str) -> str:
     """Generate a canonical ID from chassis and model names."""
     combined = f"{chassis}-{model}".lower()
     # Replace special characters
     id_str = combined.replace(" ", "-").replace("/", "-").replace("(", "").replace(")", "")
     id_str = id_str.replace("'", "").replace('"', "").replace(".", "").replace(",", "")
-    # Remove double dashes
-    while "--" in id_str:
-        id_str = id_str.replace("--", "-")
+    # Collapse dash runs; most names have none, so check before substituting
+    if "--" in id_str:
+        id_str = _MULTIDASH.sub("-", id_str)
     # Remove leading/trailing dashes
     return id_str.strip("-")
 
 
+@lru_cache(maxsize=8192)
 def normalize_equipment_id(name: str) -> str:
     """Normalize an equipment name to a canonical ID format."""
     id_str = name.lower()
@@ -354,8 +388,8 @@ def normalize_equipment_id(name: str) -> str:
     id_str = id_str.replace("/", "-").replace(" ", "-")
     id_str = id_str.replace("(", "").replace(")", "")
     id_str = id_str.replace("'", "").replace('"', "")
-    # Remove double dashes
-    while "--" in id_str:
-        id_str = id_str.replace("--", "-")
+    # Collapse dash runs
+    if "--" in id_str:
+        id_str = _MULTIDASH.sub("-", id_str)
     return id_str.strip("-")
 
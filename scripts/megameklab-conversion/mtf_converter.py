@@ -32,8 +32,8 @@ from enum_mappings import (
     map_unit_type,
     generate_id_from_name,
     normalize_equipment_id,
-    get_era_folder_name,
     get_rules_level_folder_name,
+    year_to_era_folder,
 )
 from mtf_serialized_models import (
     SerializedArmor,
@@ -139,7 +139,7 @@ def convert_directory(source_dir: str, output_dir: str, era_filter: Optional[str
                 continue
             
             # Get era folder from unit's year
-            era_folder = get_era_folder_name(unit.era)
+            era_folder = year_to_era_folder(unit.year)
             
             # Get rules level folder
             rules_folder = get_rules_level_folder_name(unit.rulesLevel)